@@ -1,16 +1,19 @@
 import json
-import copy
 import warnings
+from http.cookiejar import DefaultCookiePolicy
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from yarl import URL
 from fhirpy.base.searchset import AbstractSearchSet
 from fhirpy.base.resource import BaseResource, BaseReference
 from fhirpy.base.utils import (
-    AttrDict, encode_params, get_by_path, parse_pagination_url
+    AttrDict, encode_params, get_by_path, get_data_hash, parse_pagination_url
 )
 from fhirpy.base.exceptions import (
     ResourceNotFound, OperationOutcome, InvalidResponse, MultipleResourcesFound
@@ -21,14 +24,25 @@ class AbstractClient(ABC):
     url = None
     authorization = None
     extra_headers = None
-
-    def __init__(self, url, authorization=None, extra_headers=None):
+    skip_unchanged_save = False
+    saved_resources_cache_size = 1024
+
+    def __init__(
+        self,
+        url,
+        authorization=None,
+        extra_headers=None,
+        skip_unchanged_save=False
+    ):
         self.url = url
         self.authorization = authorization
         self.extra_headers = extra_headers
+        self.skip_unchanged_save = skip_unchanged_save
+        # Maps reference of resource to the hash of its content on the server
+        self._saved_resources = OrderedDict()
 
     def __str__(self):  # pragma: no cover
-        return '<{0} {1}>'.format(self.__class__.__name__, self.url)
+        return f'<{self.__class__.__name__} {self.url}>'
 
     def __repr__(self):  # pragma: no cover
         return self.__str__()
@@ -68,6 +82,30 @@ class AbstractClient(ABC):
     def _fetch_resource(self, path, params=None):
         pass
 
+    def _is_resource_saved(self, resource, data):
+        """
+        Returns True if `data` of resource is known to match the server
+        """
+        if not self.skip_unchanged_save or not resource.id:
+            return False
+
+        return self._saved_resources.get(resource.reference) == \
+            get_data_hash(data)
+
+    def _remember_saved_resource(self, resource):
+        if not self.skip_unchanged_save or not resource.id:
+            return
+
+        reference = resource.reference
+        self._saved_resources[reference] = get_data_hash(resource.serialize())
+        self._saved_resources.move_to_end(reference)
+        if len(self._saved_resources) > self.saved_resources_cache_size:
+            self._saved_resources.popitem(last=False)
+
+    def _forget_saved_resource(self, resource):
+        if resource.id:
+            self._saved_resources.pop(resource.reference, None)
+
     def _build_request_headers(self):
         headers = {'Authorization': self.authorization}
 
@@ -86,8 +124,7 @@ class AbstractClient(ABC):
                     ' (possible security issue)'
                 )
 
-        params = params or {}
-        params['_format'] = 'json'
+        params = {**(params or {}), '_format': 'json'}
         return f'{self.url}/{path.lstrip("/")}?{encode_params(params)}'
 
 
@@ -102,7 +139,7 @@ class AsyncClient(AbstractClient, ABC):
             method, url, json=data, headers=headers
         ) as r:
             if 200 <= r.status < 300:
-                data = await r.text()
+                data = await r.read()
                 return json.loads(data, object_hook=AttrDict)
 
             if r.status == 404 or r.status == 410:
@@ -115,17 +152,59 @@ class AsyncClient(AbstractClient, ABC):
 
 
 class SyncClient(AbstractClient, ABC):
+    def __init__(self, *args, **kwargs):
+        super(SyncClient, self).__init__(*args, **kwargs)
+        self._session = self._build_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes pooled connections to the server
+        """
+        self._session.close()
+
+    def _build_session(self):
+        """
+        Returns session which keeps connections alive between requests.
+        Connection errors and gateway errors of idempotent requests
+        are retried up to 3 times with backoff. Retry-After header is
+        ignored, so the client never waits for the time set by the server
+        """
+        session = requests.Session()
+        # Don't store cookies from responses, every request is independent
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+                respect_retry_after_header=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
     def execute(self, path, method='post', **kwargs):
         return self._do_request(method, path, **kwargs)
 
     def _do_request(self, method, path, data=None, params=None):
         headers = self._build_request_headers()
         url = self._build_request_url(path, params)
-        r = requests.request(method, url, json=data, headers=headers)
+        r = self._session.request(method, url, json=data, headers=headers)
 
         if 200 <= r.status_code < 300:
             return json.loads(
-                r.content.decode(), object_hook=AttrDict
+                r.content, object_hook=AttrDict
             ) if r.content else None
 
         if r.status_code == 404 or r.status_code == 410:
@@ -138,6 +217,8 @@ class SyncClient(AbstractClient, ABC):
 
 
 class SyncSearchSet(AbstractSearchSet, ABC):
+    __slots__ = ()
+
     def fetch(self):
         bundle_data = self.client._fetch_resource(
             self.resource_type, self.params
@@ -156,7 +237,7 @@ class SyncSearchSet(AbstractSearchSet, ABC):
         return data
 
     def fetch_all(self):
-        return list([x for x in self])
+        return list(self)
 
     def get(self, id=None):
         searchset = self.limit(2)
@@ -178,9 +259,7 @@ class SyncSearchSet(AbstractSearchSet, ABC):
         return self._perform_resource(resource)
 
     def count(self):
-        new_params = copy.deepcopy(self.params)
-        new_params['_count'] = 0
-        new_params['_totalMethod'] = 'count'
+        new_params = {**self.params, '_count': 0, '_totalMethod': 'count'}
 
         return self.client._fetch_resource(
             self.resource_type, params=new_params
@@ -191,6 +270,9 @@ class SyncSearchSet(AbstractSearchSet, ABC):
 
         return result[0] if result else None
 
+    def last(self):
+        return self.reverse_sort().first()
+
     def __iter__(self):
         next_link = None
         while True:
@@ -200,10 +282,9 @@ class SyncSearchSet(AbstractSearchSet, ABC):
                 bundle_data = self.client._fetch_resource(
                     self.resource_type, self.params
                 )
-            new_resources = self._get_bundle_resources(bundle_data)
             next_link = get_by_path(bundle_data, ['link', {'relation': 'next'}, 'url'])
 
-            for item in new_resources:
+            for item in self._iter_bundle_resources(bundle_data):
                 yield item
 
             if not next_link:
@@ -211,6 +292,8 @@ class SyncSearchSet(AbstractSearchSet, ABC):
 
 
 class AsyncSearchSet(AbstractSearchSet, ABC):
+    __slots__ = ()
+
     async def fetch(self):
         bundle_data = await self.client._fetch_resource(
             self.resource_type, self.params
@@ -231,7 +314,7 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
         return data
 
     async def fetch_all(self):
-        return list([x async for x in self])
+        return [x async for x in self]
 
     async def get(self, id=None):
         searchset = self.limit(2)
@@ -253,9 +336,7 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
         return self._perform_resource(resource)
 
     async def count(self):
-        new_params = copy.deepcopy(self.params)
-        new_params['_count'] = 0
-        new_params['_totalMethod'] = 'count'
+        new_params = {**self.params, '_count': 0, '_totalMethod': 'count'}
 
         return (
             await
@@ -267,6 +348,9 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
 
         return result[0] if result else None
 
+    async def last(self):
+        return await self.reverse_sort().first()
+
     async def __aiter__(self):
         next_link = None
         while True:
@@ -276,10 +360,9 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
                 bundle_data = await self.client._fetch_resource(
                     self.resource_type, self.params
                 )
-            new_resources = self._get_bundle_resources(bundle_data)
             next_link = get_by_path(bundle_data, ['link', {'relation': 'next'}, 'url'])
 
-            for item in new_resources:
+            for item in self._iter_bundle_resources(bundle_data):
                 yield item
 
             if not next_link:
@@ -287,7 +370,9 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
 
 
 class SyncResource(BaseResource, ABC):
-    def save(self, fields=None):
+    __slots__ = ()
+
+    def save(self, fields=None, force=False):
         data = self.serialize()
         if fields:
             if not self.id:
@@ -296,6 +381,8 @@ class SyncResource(BaseResource, ABC):
             method = 'patch'
         else:
             method = 'put' if self.id else 'post'
+            if not force and self.client._is_resource_saved(self, data):
+                return
         response_data = self.client._do_request(
             method,
             self._get_path(),
@@ -304,24 +391,25 @@ class SyncResource(BaseResource, ABC):
         if response_data:
             super(BaseResource, self).clear()
             super(BaseResource, self).update(**self.client.resource(self.resource_type, **response_data))
+        self._update_saved_state(fields, response_data)
 
     def update(self, **kwargs):
         super(BaseResource, self).update(**kwargs)
         self.save(fields=kwargs.keys())
 
     def delete(self):
+        self.client._forget_saved_resource(self)
         return self.client._do_request('delete', self._get_path())
 
     def refresh(self):
         data = self.client._do_request('get', self._get_path())
         super(BaseResource, self).clear()
         super(BaseResource, self).update(**data)
+        self.client._remember_saved_resource(self)
 
     def is_valid(self, raise_exception=False):
         data = self.client._do_request(
-            'post',
-            '{0}/$validate'.format(self.resource_type),
-            data=self.serialize()
+            'post', f'{self.resource_type}/$validate', data=self.serialize()
         )
         if any(
             issue['severity'] in ['fatal', 'error'] for issue in data['issue']
@@ -333,15 +421,14 @@ class SyncResource(BaseResource, ABC):
 
     def execute(self, operation, method='post', data=None, params=None):
         return self.client._do_request(
-            method,
-            '{0}/{1}'.format(self._get_path(), operation),
-            data=data,
-            params=params
+            method, f'{self._get_path()}/{operation}', data=data, params=params
         )
 
 
 class AsyncResource(BaseResource, ABC):
-    async def save(self, fields=None):
+    __slots__ = ()
+
+    async def save(self, fields=None, force=False):
         data = self.serialize()
         if fields:
             if not self.id:
@@ -350,6 +437,8 @@ class AsyncResource(BaseResource, ABC):
             method = 'patch'
         else:
             method = 'put' if self.id else 'post'
+            if not force and self.client._is_resource_saved(self, data):
+                return
 
         response_data = await self.client._do_request(
             method,
@@ -359,27 +448,28 @@ class AsyncResource(BaseResource, ABC):
         if response_data:
             super(BaseResource, self).clear()
             super(BaseResource, self).update(**self.client.resource(self.resource_type, **response_data))
+        self._update_saved_state(fields, response_data)
 
     async def update(self, **kwargs):
         super(BaseResource, self).update(**kwargs)
         await self.save(fields=kwargs.keys())
 
     async def delete(self):
+        self.client._forget_saved_resource(self)
         return await self.client._do_request('delete', self._get_path())
 
     async def refresh(self):
         data = await self.client._do_request('get', self._get_path())
         super(BaseResource, self).clear()
         super(BaseResource, self).update(**data)
+        self.client._remember_saved_resource(self)
 
     async def to_resource(self):
         return super(AsyncResource, self).to_resource()
 
     async def is_valid(self, raise_exception=False):
         data = await self.client._do_request(
-            'post',
-            '{0}/$validate'.format(self.resource_type),
-            data=self.serialize()
+            'post', f'{self.resource_type}/$validate', data=self.serialize()
         )
         if any(
             issue['severity'] in ['fatal', 'error'] for issue in data['issue']
@@ -391,11 +481,13 @@ class AsyncResource(BaseResource, ABC):
 
     async def execute(self, operation, method='post', **kwargs):
         return await self.client._do_request(
-            method, '{0}/{1}'.format(self._get_path(), operation), **kwargs
+            method, f'{self._get_path()}/{operation}', **kwargs
         )
 
 
 class SyncReference(BaseReference, ABC):
+    __slots__ = ()
+
     def to_resource(self):
         """
         Returns Resource instance for this reference
@@ -410,13 +502,13 @@ class SyncReference(BaseReference, ABC):
         if not self.is_local:
             raise ResourceNotFound('Can not execute on not local resource')
         return self.client._do_request(
-            method,
-            '{0}/{1}/{2}'.format(self.resource_type, self.id,
-                                 operation), **kwargs
+            method, f'{self.resource_type}/{self.id}/{operation}', **kwargs
         )
 
 
 class AsyncReference(BaseReference, ABC):
+    __slots__ = ()
+
     async def to_resource(self):
         """
         Returns Resource instance for this reference
@@ -431,7 +523,5 @@ class AsyncReference(BaseReference, ABC):
         if not self.is_local:
             raise ResourceNotFound('Can not execute on not local resource')
         return await self.client._do_request(
-            method,
-            '{0}/{1}/{2}'.format(self.resource_type, self.id,
-                                 operation), **kwargs
+            method, f'{self.resource_type}/{self.id}/{operation}', **kwargs
         )
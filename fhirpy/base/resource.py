@@ -1,11 +1,20 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from fhirpy.base.exceptions import ResourceNotFound
 from fhirpy.base.utils import parse_path, get_by_path, convert_values
 
 
+@lru_cache(maxsize=None)
+def get_class_attrs(cls):
+    """
+    Returns names of all attributes defined on the class and its bases
+    """
+    return frozenset(dir(cls))
+
+
 class AbstractResource(dict):
-    client = None
+    __slots__ = ('client', )
 
     def __init__(self, client, **kwargs):
         self.client = client
@@ -26,11 +35,14 @@ class AbstractResource(dict):
         return self[key]
 
     def __setattr__(self, key, value):
-        try:
-            super().__getattribute__(key)
-            super().__setattr__(key, value)
-        except AttributeError:
-            self[key] = value
+        if key in get_class_attrs(type(self)):
+            try:
+                super().__setattr__(key, value)
+                return
+            except AttributeError:
+                # Read-only property, e.g. reference's `resource_type`
+                pass
+        self[key] = value
 
     def get_by_path(self, path, default=None):
         keys = parse_path(path)
@@ -71,7 +83,7 @@ class AbstractResource(dict):
 
 
 class BaseResource(AbstractResource, ABC):
-    resource_type = None
+    __slots__ = ('resource_type', )
 
     def __init__(self, client, resource_type, **kwargs):
         def convert_fn(item):
@@ -99,13 +111,13 @@ class BaseResource(AbstractResource, ABC):
         super(BaseResource, self).__setitem__(key, value)
 
     def __str__(self):  # pragma: no cover
-        return '<{0} {1}>'.format(self.__class__.__name__, self._get_path())
+        return f'<{self.__class__.__name__} {self._get_path()}>'
 
     def __repr__(self):  # pragma: no cover
         return self.__str__()
 
     @abstractmethod  # pragma: no cover
-    def save(self, fields=None):
+    def save(self, fields=None, force=False):
         pass
 
     @abstractmethod  # pragma: no cover
@@ -120,6 +132,13 @@ class BaseResource(AbstractResource, ABC):
     def refresh(self):
         pass
 
+    def _update_saved_state(self, fields, response_data):
+        if fields and not response_data:
+            # Only some fields were patched, so local data may differ
+            self.client._forget_saved_resource(self)
+        else:
+            self.client._remember_saved_resource(self)
+
     def to_resource(self):
         """
         Returns Resource instance for this resource
@@ -159,11 +178,11 @@ class BaseResource(AbstractResource, ABC):
         Returns reference if local resource is saved
         """
         if self.id:
-            return '{0}/{1}'.format(self.resource_type, self.id)
+            return f'{self.resource_type}/{self.id}'
 
     def _get_path(self):
         if self.id:
-            return '{0}/{1}'.format(self.resource_type, self.id)
+            return f'{self.resource_type}/{self.id}'
         elif self.resource_type == 'Bundle':
             return ''
 
@@ -171,8 +190,10 @@ class BaseResource(AbstractResource, ABC):
 
 
 class BaseReference(AbstractResource):
+    __slots__ = ()
+
     def __str__(self):  # pragma: no cover
-        return '<{0} {1}>'.format(self.__class__.__name__, self.reference)
+        return f'<{self.__class__.__name__} {self.reference}>'
 
     def __repr__(self):  # pragma: no cover
         return self.__str__()
@@ -1,7 +1,7 @@
-import copy
 import datetime
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from functools import lru_cache
 
 import pytz
 
@@ -62,6 +62,46 @@ class Raw:
         self.kwargs = kwargs
 
 
+@lru_cache(maxsize=1024)
+def parse_search_key(key: str):
+    """
+    Transforms SQ keyword argument name into search param name
+    and value prefix. The result is cached because the same keys
+    are used over and over again
+
+    >>> parse_search_key('patient__Patient__birth_date__ge')
+    ('patient:Patient.birth-date', 'ge')
+
+    >>> parse_search_key('url__not_in')
+    ('url:not-in', None)
+    """
+    key_parts = key.split('__')
+
+    op = None
+    if len(key_parts) % 2 == 0:
+        # The operator is always the last part,
+        # e.g., birth_date__ge or patient__Patient__birth_date__ge
+        op = key_parts[-1]
+        key_parts = key_parts[:-1]
+
+    base_param, *chained_params = key_parts
+    param_parts = [base_param]
+    if chained_params:
+        param_parts.extend([
+            '.'.join(pair) for pair in chunks(chained_params, 2)])
+    param = ':'.join(param_parts)
+
+    prefix = None
+    if op:
+        if op in ['contains', 'exact', 'missing', 'not',
+                  'below', 'above', 'in', 'not_in', 'text', 'of_type']:
+            param = f'{param}:{transform_param(op)}'
+        elif op in ['eq', 'ne', 'gt', 'ge', 'lt', 'le', 'sa', 'eb', 'ap']:
+            prefix = op
+
+    return transform_param(param), prefix
+
+
 def SQ(*args, **kwargs):
     """
     Builds search query
@@ -114,29 +154,10 @@ def SQ(*args, **kwargs):
         value = value if isinstance(value, list) else [value]
         value = [transform_value(sub_value) for sub_value in value]
 
-        key_parts = key.split('__')
-
-        op = None
-        if len(key_parts) % 2 == 0:
-            # The operator is always the last part,
-            # e.g., birth_date__ge or patient__Patient__birth_date__ge
-            op = key_parts[-1]
-            key_parts = key_parts[:-1]
-
-        base_param, *chained_params = key_parts
-        param_parts = [base_param]
-        if chained_params:
-            param_parts.extend([
-                '.'.join(pair) for pair in chunks(chained_params, 2)])
-        param = ':'.join(param_parts)
-
-        if op:
-            if op in ['contains', 'exact', 'missing', 'not',
-                      'below', 'above', 'in', 'not_in', 'text', 'of_type']:
-                param = '{0}:{1}'.format(param, transform_param(op))
-            elif op in ['eq', 'ne', 'gt', 'ge', 'lt', 'le', 'sa', 'eb', 'ap']:
-                value = ['{0}{1}'.format(op, sub_value) for sub_value in value]
-        res[transform_param(param)].extend(value)
+        param, prefix = parse_search_key(key)
+        if prefix:
+            value = [f'{prefix}{sub_value}' for sub_value in value]
+        res[param].extend(value)
 
     for arg in args:
         if isinstance(arg, Raw):
@@ -150,9 +171,7 @@ def SQ(*args, **kwargs):
 
 
 class AbstractSearchSet(ABC):
-    client = None
-    resource_type = None
-    params = None
+    __slots__ = ('client', 'resource_type', 'params')
 
     def __init__(self, client, resource_type, params=None):
         self.client = client
@@ -188,8 +207,18 @@ class AbstractSearchSet(ABC):
     def first(self):
         pass
 
+    @abstractmethod  # pragma: no cover
+    def last(self):
+        pass
+
     def clone(self, override=False, **kwargs):
-        new_params = copy.deepcopy(self.params)
+        # Values are lists of scalars, so copying the lists is enough
+        new_params = defaultdict(
+            list, {
+                key: list(value) if isinstance(value, list) else value
+                for key, value in self.params.items()
+            }
+        )
         for key, value in kwargs.items():
             if not isinstance(value, list):
                 value = [value]
@@ -294,16 +323,35 @@ class AbstractSearchSet(ABC):
         sort_keys = ','.join(keys)
         return self.clone(_sort=sort_keys, override=True)
 
-    def __str__(self):  # pragma: no cover
-        return '<{0} {1}?{2}>'.format(
-            self.__class__.__name__, self.resource_type,
-            encode_params(self.params)
+    def reverse_sort(self):
+        """
+        Returns search set with the reversed sort order.
+        Search set without sort is sorted by `-_lastUpdated`
+        """
+        sort_keys = ','.join(self.params.get('_sort', [])).split(',')
+        sort_keys = [key for key in sort_keys if key] or ['_lastUpdated']
+
+        return self.sort(
+            *[
+                key[1:] if key.startswith('-') else '-' + key
+                for key in sort_keys
+            ]
         )
 
+    def __str__(self):  # pragma: no cover
+        return f'<{self.__class__.__name__} {self.resource_type}' \
+               f'?{encode_params(self.params)}>'
+
     def __repr__(self):  # pragma: no cover
         return self.__str__()
 
     def _get_bundle_resources(self, bundle_data):
+        return list(self._iter_bundle_resources(bundle_data))
+
+    def _iter_bundle_resources(self, bundle_data):
+        """
+        Lazily yields resources of the search set type from the bundle
+        """
         bundle_resource_type = bundle_data.get('resourceType', None)
 
         if bundle_resource_type != 'Bundle':
@@ -312,13 +360,7 @@ class AbstractSearchSet(ABC):
                 'but {0} received'.format(bundle_resource_type)
             )
 
-        resources_data = [
-            res['resource'] for res in bundle_data.get('entry', [])
-        ]
-
-        resources = []
-        for data in resources_data:
-            resource = self._perform_resource(data)
-            if resource.resource_type == self.resource_type:
-                resources.append(resource)
-        return resources
+        for res in bundle_data.get('entry', []):
+            # Skip included resources of other types before instantiating them
+            if res['resource'].get('resourceType') == self.resource_type:
+                yield self._perform_resource(res['resource'])
@@ -1,3 +1,5 @@
+import json
+import hashlib
 import reprlib
 from urllib.parse import urlencode, quote, parse_qs, urlparse
 from yarl import URL
@@ -87,7 +89,7 @@ def parse_pagination_url(url):
 
 def convert_values(data, fn):
     """
-    Recursively converts data values with `fn`
+    Converts nested data values with `fn`
     which must return tuple of (converted data, stop flag).
     Conversion will be stopped for this branch if stop flag is True
 
@@ -114,18 +116,52 @@ def convert_values(data, fn):
     """
 
     data, stop = fn(data)
-
     if stop:
         return data
 
+    root = _make_container(data)
+    if root is None:
+        return data
+
+    # Walk the tree with an explicit stack instead of recursion
+    stack = [(data, root)]
+    while stack:
+        source, target = stack.pop()
+        is_list = isinstance(target, list)
+        items = enumerate(source) if is_list else source.items()
+        for key, value in items:
+            value, stop = fn(value)
+            if not stop:
+                container = _make_container(value)
+                if container is not None:
+                    stack.append((value, container))
+                    value = container
+
+            if is_list:
+                target.append(value)
+            else:
+                target[key] = value
+
+    return root
+
+
+def _make_container(data):
     if isinstance(data, list):
-        return SearchList(convert_values(x, fn) for x in data)
+        return SearchList()
     if isinstance(data, dict):
-        return AttrDict(
-            {key: convert_values(value, fn)
-             for key, value in data.items()}
-        )
-    return data
+        return AttrDict()
+    return None
+
+
+def get_data_hash(data):
+    """
+    Returns hash of JSON-like data which does not depend on keys order
+
+    >>> get_data_hash({'a': 1, 'b': [1, 2]}) == get_data_hash({'b': [1, 2], 'a': 1})
+    True
+    """
+    dumped = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.blake2b(dumped.encode(), digest_size=16).hexdigest()
 
 
 def parse_path(path):
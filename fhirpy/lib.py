@@ -6,34 +6,40 @@ from .base import (
     AsyncResource, SyncReference, AsyncReference
 )
 
+REFERENCE_KEYS = frozenset(
+    ['reference', 'display', 'type', 'identifier', 'extension']
+)
+
 
 class SyncFHIRSearchSet(SyncSearchSet):
-    pass
+    __slots__ = ()
 
 
 class AsyncFHIRSearchSet(AsyncSearchSet):
-    pass
+    __slots__ = ()
 
 
 class BaseFHIRResource(BaseResource, ABC):
+    __slots__ = ()
+
     def is_reference(self, value):
         if not isinstance(value, dict):
             return False
 
-        return 'reference' in value and \
-               not (set(value.keys()) - {
-                   'reference', 'display', 'type', 'identifier', 'extension'})
+        return 'reference' in value and value.keys() <= REFERENCE_KEYS
 
 
 class SyncFHIRResource(BaseFHIRResource, SyncResource):
-    pass
+    __slots__ = ()
 
 
 class AsyncFHIRResource(BaseFHIRResource, AsyncResource):
-    pass
+    __slots__ = ()
 
 
 class BaseFHIRReference(BaseReference, ABC):
+    __slots__ = ()
+
     @property
     def reference(self):
         return self['reference']
@@ -43,40 +49,53 @@ class BaseFHIRReference(BaseReference, ABC):
         """
         Returns id if reference specifies to the local resource
         """
-        if self.is_local:
-            return self.reference.split('/', 1)[1]
+        return self._split_local_reference()[1]
 
     @property
     def resource_type(self):
         """
         Returns resource type if reference specifies to the local resource
         """
-        if self.is_local:
-            return self.reference.split('/', 1)[0]
+        return self._split_local_reference()[0]
 
     @property
     def is_local(self):
         return self.reference.count('/') == 1
 
+    def _split_local_reference(self):
+        parts = self.reference.split('/')
+        if len(parts) == 2:
+            return parts
+
+        return None, None
+
 
 class SyncFHIRReference(BaseFHIRReference, SyncReference):
-    pass
+    __slots__ = ()
 
 
 class AsyncFHIRReference(BaseFHIRReference, AsyncReference):
-    pass
+    __slots__ = ()
 
 
 class SyncFHIRClient(SyncClient):
     searchset_class = SyncFHIRSearchSet
     resource_class = SyncFHIRResource
 
-    def __init__(self, url, authorization=None, extra_headers=None):
-        super(SyncFHIRClient, self).__init__(url, authorization, extra_headers)
+    def __init__(
+        self,
+        url,
+        authorization=None,
+        extra_headers=None,
+        skip_unchanged_save=False
+    ):
+        super(SyncFHIRClient, self).__init__(
+            url, authorization, extra_headers, skip_unchanged_save
+        )
 
     def reference(self, resource_type=None, id=None, reference=None, **kwargs):
         if resource_type and id:
-            reference = '{0}/{1}'.format(resource_type, id)
+            reference = f'{resource_type}/{id}'
 
         if not reference:
             raise TypeError(
@@ -90,12 +109,20 @@ class AsyncFHIRClient(AsyncClient):
     searchset_class = AsyncFHIRSearchSet
     resource_class = AsyncFHIRResource
 
-    def __init__(self, url, authorization=None, extra_headers=None):
-        super(AsyncFHIRClient, self).__init__(url, authorization, extra_headers)
+    def __init__(
+        self,
+        url,
+        authorization=None,
+        extra_headers=None,
+        skip_unchanged_save=False
+    ):
+        super(AsyncFHIRClient, self).__init__(
+            url, authorization, extra_headers, skip_unchanged_save
+        )
 
     def reference(self, resource_type=None, id=None, reference=None, **kwargs):
         if resource_type and id:
-            reference = '{0}/{1}'.format(resource_type, id)
+            reference = f'{resource_type}/{id}'
 
         if not reference:
             raise TypeError(
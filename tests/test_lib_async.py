@@ -304,6 +304,106 @@ class TestLibAsyncCase:
         assert isinstance(patient, AsyncFHIRResource)
         assert patient.id == 'patient_first'
 
+    def get_skipping_client(self, responses):
+        """
+        Returns client which skips unchanged saves and
+        answers requests with `responses` by HTTP method
+        """
+        client = AsyncFHIRClient(self.URL, skip_unchanged_save=True)
+
+        async def do_request(method, path, data=None, params=None):
+            return responses[method]
+
+        client._do_request = Mock(side_effect=do_request)
+        return client
+
+    def get_request_methods(self, client):
+        return [call[0][0] for call in client._do_request.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_save_unchanged_resource_skips_request(self):
+        client = self.get_skipping_client(
+            {'put': {'resourceType': 'Patient', 'id': 'patient'}}
+        )
+        patient = client.resource('Patient', id='patient')
+        await patient.save()
+        await patient.save()
+        assert self.get_request_methods(client) == ['put']
+
+        await patient.save(force=True)
+        assert self.get_request_methods(client) == ['put', 'put']
+
+        patient['active'] = True
+        await patient.save()
+        assert self.get_request_methods(client) == ['put', 'put', 'put']
+
+    @pytest.mark.asyncio
+    async def test_save_after_delete_sends_request(self):
+        client = self.get_skipping_client(
+            {
+                'put': {'resourceType': 'Patient', 'id': 'patient'},
+                'delete': None,
+            }
+        )
+        patient = client.resource('Patient', id='patient')
+        await patient.save()
+        await patient.delete()
+        await patient.save()
+        assert self.get_request_methods(client) == ['put', 'delete', 'put']
+
+    @pytest.mark.asyncio
+    async def test_save_after_refresh_skips_request(self):
+        client = self.get_skipping_client(
+            {'get': {'resourceType': 'Patient', 'id': 'patient'}}
+        )
+        patient = client.resource('Patient', id='patient')
+        await patient.refresh()
+        await patient.save()
+        assert self.get_request_methods(client) == ['get']
+
+    @pytest.mark.asyncio
+    async def test_save_after_patch_without_response_sends_request(self):
+        client = self.get_skipping_client(
+            {
+                'put': {'resourceType': 'Patient', 'id': 'patient'},
+                'patch': None,
+            }
+        )
+        patient = client.resource('Patient', id='patient')
+        await patient.save()
+        patient['active'] = True
+        await patient.save(fields=['active'])
+        await patient.save()
+        assert self.get_request_methods(client) == ['put', 'patch', 'put']
+
+    @pytest.mark.asyncio
+    async def test_get_last(self):
+        await self.create_resource(
+            'Patient', id='patient_first', name=[{
+                'text': 'Abc'
+            }]
+        )
+        await self.create_resource(
+            'Patient', id='patient_second', name=[{
+                'text': 'Bbc'
+            }]
+        )
+        patient = await self.get_search_set('Patient').sort('name').last()
+        assert isinstance(patient, AsyncFHIRResource)
+        assert patient.id == 'patient_second'
+
+        patient = await self.get_search_set('Patient').sort('-name').last()
+        assert patient.id == 'patient_first'
+
+    @pytest.mark.asyncio
+    async def test_get_last_without_sort(self):
+        await self.create_resource('Patient', id='patient_first')
+        await self.create_resource('Patient', id='patient_second')
+        # Sorted by -_lastUpdated, so the last updated resource is returned
+        patient = await self.get_search_set('Patient').last()
+        assert isinstance(patient, AsyncFHIRResource)
+        assert patient.id == 'patient_second'
+
     @pytest.mark.asyncio
     async def test_fetch_raw(self):
         await self.create_resource('Patient', name=[{'text': 'RareName'}])
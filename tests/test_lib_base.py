@@ -1,7 +1,9 @@
 import pytest
 from fhirpy import SyncFHIRClient, AsyncFHIRClient
 from fhirpy.lib import BaseFHIRReference
-from fhirpy.base.utils import AttrDict, SearchList, parse_pagination_url
+from fhirpy.base.utils import (
+    AttrDict, SearchList, parse_pagination_url, convert_values
+)
 
 
 @pytest.mark.parametrize(
@@ -72,6 +74,12 @@ class TestLibBase(object):
             'id': 'p1',
         }
 
+    def test_build_request_url_keeps_params(self, client):
+        params = {'name': ['John']}
+        assert client._build_request_url('Patient', params) == \
+            'mock/Patient?name=John&_format=json'
+        assert params == {'name': ['John']}
+
     def test_reference_is_not_provided_failed(self, client):
         with pytest.raises(TypeError):
             client.reference()
@@ -189,6 +197,52 @@ class TestLibBase(object):
         assert path == '/Patient'
         assert params == {'_count': ['100'], 'name': ['ivan', 'petrov']}
 
+    def test_convert_values_keeps_order_and_types(self, client):
+        data = {
+            'a': [1, {'b': [2, 3]}, [4, {'c': 5}], 6],
+            'd': {'e': [{'f': 7}, 8]},
+        }
+        seen = []
+
+        def convert_fn(item):
+            seen.append(item)
+            return item, False
+
+        converted = convert_values(data, convert_fn)
+
+        assert converted == data
+        assert list(converted['a']) == [1, {'b': [2, 3]}, [4, {'c': 5}], 6]
+        assert isinstance(converted, AttrDict)
+        assert isinstance(converted['a'], SearchList)
+        assert isinstance(converted['a'][1], AttrDict)
+        assert isinstance(converted['a'][1]['b'], SearchList)
+        assert isinstance(converted['a'][2], SearchList)
+        assert isinstance(converted['a'][2][1], AttrDict)
+        assert isinstance(converted['d']['e'], SearchList)
+        assert isinstance(converted['d']['e'][0], AttrDict)
+        assert converted.d.e[0].f == 7
+        # Every value is passed to `fn` exactly once
+        assert sorted(x for x in seen if isinstance(x, int)) == \
+            [1, 2, 3, 4, 5, 6, 7, 8]
+        assert len(seen) == 17
+
+    def test_convert_values_deep_nesting(self, client):
+        depth = 5000
+        data = value = {}
+        for _ in range(depth):
+            value['nested'] = [{}]
+            value = value['nested'][0]
+
+        converted = convert_values(data, lambda x: (x, False))
+
+        converted_depth = 0
+        while converted:
+            assert isinstance(converted, AttrDict)
+            assert isinstance(converted['nested'], SearchList)
+            converted = converted['nested'][0]
+            converted_depth += 1
+        assert converted_depth == depth
+
     def test_accessing_property_as_attribute(self, client):
         patient = client.resource(
             'Patient', **{
@@ -1,5 +1,6 @@
 import pytest
 import responses
+from unittest.mock import patch
 
 from fhirpy import SyncFHIRClient
 from fhirpy.base.utils import AttrDict
@@ -283,6 +284,32 @@ class TestLibSyncCase:
         assert isinstance(patient, SyncFHIRResource)
         assert patient.id == 'patient_first'
 
+    def test_get_last(self):
+        self.create_resource(
+            'Patient', id='patient_first', name=[{
+                'text': 'Abc'
+            }]
+        )
+        self.create_resource(
+            'Patient', id='patient_second', name=[{
+                'text': 'Bbc'
+            }]
+        )
+        patient = self.get_search_set('Patient').sort('name').last()
+        assert isinstance(patient, SyncFHIRResource)
+        assert patient.id == 'patient_second'
+
+        patient = self.get_search_set('Patient').sort('-name').last()
+        assert patient.id == 'patient_first'
+
+    def test_get_last_without_sort(self):
+        self.create_resource('Patient', id='patient_first')
+        self.create_resource('Patient', id='patient_second')
+        # Sorted by -_lastUpdated, so the last updated resource is returned
+        patient = self.get_search_set('Patient').last()
+        assert isinstance(patient, SyncFHIRResource)
+        assert patient.id == 'patient_second'
+
     def test_fetch_raw(self):
         self.create_resource('Patient', name=[{'text': 'RareName'}])
         self.create_resource('Patient', name=[{'text': 'RareName'}])
@@ -376,6 +403,121 @@ class TestLibSyncCase:
         request_headers = responses.calls[0].request.headers
         assert request_headers['Access-Control-Allow-Origin'] == '*'
 
+    @responses.activate
+    def test_requests_use_client_session(self):
+        responses.add(
+            responses.GET,
+            self.URL + '/Patient',
+            json={'resourceType': 'Bundle'},
+            headers={'Set-Cookie': 'session=value; Path=/'},
+            status=200
+        )
+        session = self.client._session
+        with patch.object(
+            session, 'request', wraps=session.request
+        ) as mocked_request:
+            self.client.resources('Patient').fetch()
+            self.client.resources('Patient').fetch()
+
+        assert mocked_request.call_count == 2
+        assert 'Cookie' not in responses.calls[1].request.headers
+
+    @pytest.mark.parametrize('url', ['http://fhir/', 'https://fhir/'])
+    def test_session_adapter_settings(self, url):
+        adapter = self.client._session.get_adapter(url)
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 20
+
+        retry = adapter.max_retries
+        assert retry.total == 3
+        assert retry.raise_on_status is False
+        assert retry.respect_retry_after_header is False
+        for method in ['GET', 'PUT', 'DELETE']:
+            for status in [502, 503, 504]:
+                assert retry.is_retry(method, status)
+            assert not retry.is_retry(method, 500)
+            assert not retry.is_retry(method, 429, has_retry_after=True)
+            assert not retry.is_retry(method, 413, has_retry_after=True)
+        # Non-idempotent requests are not retried on error responses
+        for method in ['POST', 'PATCH']:
+            assert not retry.is_retry(method, 503)
+
+    def test_client_context_manager_closes_session(self):
+        client = SyncFHIRClient(self.URL)
+        with patch.object(client._session, 'close') as mocked_close:
+            with client as entered_client:
+                assert entered_client is client
+                mocked_close.assert_not_called()
+            mocked_close.assert_called_once_with()
+
+    def get_skipping_client(self):
+        return SyncFHIRClient(self.URL, skip_unchanged_save=True)
+
+    def add_patient_response(self, method, status=200, **kwargs):
+        kwargs.setdefault(
+            'json', {
+                'resourceType': 'Patient',
+                'id': 'patient'
+            }
+        )
+        responses.add(
+            method, self.URL + '/Patient/patient', status=status, **kwargs
+        )
+
+    @responses.activate
+    def test_save_unchanged_resource_sends_request_by_default(self):
+        self.add_patient_response(responses.PUT)
+        patient = self.client.resource('Patient', id='patient')
+        patient.save()
+        patient.save()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_save_unchanged_resource_skips_request(self):
+        self.add_patient_response(responses.PUT)
+        patient = self.get_skipping_client().resource('Patient', id='patient')
+        patient.save()
+        patient.save()
+        assert len(responses.calls) == 1
+
+        patient.save(force=True)
+        assert len(responses.calls) == 2
+
+        patient['active'] = True
+        patient.save()
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_save_after_delete_sends_request(self):
+        self.add_patient_response(responses.PUT)
+        self.add_patient_response(responses.DELETE)
+        patient = self.get_skipping_client().resource('Patient', id='patient')
+        patient.save()
+        patient.delete()
+        patient.save()
+        assert [call.request.method for call in responses.calls] == \
+            ['PUT', 'DELETE', 'PUT']
+
+    @responses.activate
+    def test_save_after_refresh_skips_request(self):
+        self.add_patient_response(responses.GET)
+        patient = self.get_skipping_client().resource('Patient', id='patient')
+        patient.refresh()
+        patient.save()
+        assert [call.request.method for call in responses.calls] == ['GET']
+
+    @responses.activate
+    def test_save_after_patch_without_response_sends_request(self):
+        self.add_patient_response(responses.PUT)
+        self.add_patient_response(responses.PATCH, body='', json=None)
+        patient = self.get_skipping_client().resource('Patient', id='patient')
+        patient.save()
+        patient['active'] = True
+        patient.save(fields=['active'])
+        patient.save()
+        assert [call.request.method for call in responses.calls] == \
+            ['PUT', 'PATCH', 'PUT']
+
     def test_save_fields(self):
         patient = self.create_resource(
             'Patient', id='patient_to_update',
@@ -20,11 +20,26 @@ class TestSearchSet(object):
             'birth-date': ['2010-01-01']
         }
 
+    def test_search_does_not_change_parent(self, client):
+        parent = client.resources('Patient').search(name='John')
+        child = parent.search(name='Smith')
+        assert parent.params == {'name': ['John']}
+        assert child.params == {'name': ['John', 'Smith']}
+
     def test_sort(self, client):
         search_set = client.resources('Patient') \
             .sort('id').sort('deceased')
         assert search_set.params == {'_sort': ['deceased']}
 
+    def test_reverse_sort(self, client):
+        search_set = client.resources('Patient') \
+            .sort('active', '-birthdate').reverse_sort()
+        assert search_set.params == {'_sort': ['-active,birthdate']}
+
+    def test_reverse_sort_without_sort(self, client):
+        search_set = client.resources('Patient').reverse_sort()
+        assert search_set.params == {'_sort': ['-_lastUpdated']}
+
     def test_limit(self, client):
         search_set = client.resources('Patient') \
             .limit(1).limit(2)